@@ -1,8 +1,130 @@
+import io
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
-from bs_functions import black_scholes, option_greeks
+from bs_functions import black_scholes, option_greeks_fast, price_and_greeks
+
+# Largest heatmap resolution that still gets per-cell price annotations
+HEATMAP_ANNOT_MAX = 15
+
+# Number of underlying prices sampled for the Greeks plots; the curves are
+# smooth in S, so this is visually indistinguishable from a finer grid
+N_PLOT = 40
+
+@st.cache_data(max_entries=64)
+def _price_grid(S_min, S_max, sigma_min, sigma_max, K, T, r, option_type, resolution=10):
+    """
+    Compute the option price heatmap grid, cached across Streamlit reruns.
+
+    Returns:
+    - S_values, sigma_values, option_prices
+    """
+    # Generate values for S and sigma in single precision; the heatmap only
+    # displays two decimals
+    S_values = np.linspace(S_min, S_max, resolution, dtype=np.float32)
+    sigma_values = np.linspace(sigma_min, sigma_max, resolution, dtype=np.float32)
+
+    # Calculate option prices over the grid; rows follow sigma and columns
+    # follow S through broadcasting, without materializing a meshgrid
+    option_prices = black_scholes(S_values[np.newaxis, :], K, T, r,
+                                  sigma_values[:, np.newaxis], option_type)
+
+    return S_values, sigma_values, option_prices
+
+@st.cache_data(max_entries=64)
+def _greeks_line(S_min, S_max, K, T, r, sigma, option_type):
+    """
+    Compute the Greeks along a line of underlying prices, cached across Streamlit reruns.
+
+    Returns:
+    - S_plot, delta, gamma, theta, vega
+    """
+    S_plot = np.linspace(S_min, S_max, N_PLOT)
+    delta, gamma, theta, vega = option_greeks_fast(S_plot, K, T, r, sigma, option_type)
+
+    return S_plot, delta, gamma, theta, vega
+
+def _figure_png(fig):
+    """
+    Render a matplotlib figure to PNG bytes and release it.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    return buf.getvalue()
+
+@st.cache_data(max_entries=64)
+def render_heatmap_png(option_prices, S_values, sigma_values, option_type):
+    """
+    Render the option price heatmap to PNG bytes, cached across Streamlit reruns.
+    """
+    fig, ax = plt.subplots(figsize=(14, 8), constrained_layout=True)
+    im = ax.pcolormesh(S_values, sigma_values, option_prices,
+                       cmap='viridis', shading='nearest')
+    fig.colorbar(im, ax=ax)
+
+    # Lowest volatility on top, as in a table
+    ax.invert_yaxis()
+
+    if len(S_values) <= HEATMAP_ANNOT_MAX:
+        ax.set_xticks(S_values, labels=np.round(S_values, 2))
+        ax.set_yticks(sigma_values, labels=np.round(sigma_values, 2))
+
+        # Dark text on the bright end of viridis, light text elsewhere
+        shades = im.norm(option_prices)
+        for i, sigma_value in enumerate(sigma_values):
+            for j, S_value in enumerate(S_values):
+                ax.text(S_value, sigma_value, f"{option_prices[i, j]:.2f}",
+                        ha="center", va="center", fontsize=7,
+                        color="black" if shades[i, j] > 0.5 else "white")
+
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right", fontsize=10)
+    plt.setp(ax.get_yticklabels(), fontsize=10)
+
+    ax.set_xlabel("Underlying Price (S)", fontsize=12)
+    ax.set_ylabel("Volatility (σ)", fontsize=12)
+    ax.set_title(f"{option_type} Option Price Heatmap", fontsize=14)
+
+    return _figure_png(fig)
+
+@st.cache_data(max_entries=64)
+def render_greeks_png(S_plot, delta_p, gamma_p, theta_p, vega_p):
+    """
+    Render the 2x2 Greeks vs underlying price figure to PNG bytes, cached
+    across Streamlit reruns.
+    """
+    fig, axs = plt.subplots(2, 2, figsize=(14, 10), constrained_layout=True)
+    axs = axs.flatten()
+
+    # Delta
+    axs[0].plot(S_plot, delta_p, color='cyan')
+    axs[0].set_title('Delta vs Underlying Price', fontsize=12)
+    axs[0].set_xlabel('Underlying Price (S)', fontsize=10)
+    axs[0].set_ylabel('Delta', fontsize=10)
+    axs[0].grid(True)
+
+    # Gamma
+    axs[1].plot(S_plot, gamma_p, color='magenta')
+    axs[1].set_title('Gamma vs Underlying Price', fontsize=12)
+    axs[1].set_xlabel('Underlying Price (S)', fontsize=10)
+    axs[1].set_ylabel('Gamma', fontsize=10)
+    axs[1].grid(True)
+
+    # Theta
+    axs[2].plot(S_plot, theta_p, color='yellow')
+    axs[2].set_title('Theta vs Underlying Price', fontsize=12)
+    axs[2].set_xlabel('Underlying Price (S)', fontsize=10)
+    axs[2].set_ylabel('Theta', fontsize=10)
+    axs[2].grid(True)
+
+    # Vega
+    axs[3].plot(S_plot, vega_p, color='green')
+    axs[3].set_title('Vega vs Underlying Price', fontsize=12)
+    axs[3].set_xlabel('Underlying Price (S)', fontsize=10)
+    axs[3].set_ylabel('Vega', fontsize=10)
+    axs[3].grid(True)
+
+    return _figure_png(fig)
 
 def main():
     # Custom CSS for better styling
@@ -59,12 +181,11 @@ def main():
         K = st.number_input("Strike Price", value=100.0, min_value=0.01)
         T = st.number_input("Time to Expiry (Years)", value=1.0, min_value=0.01)
         r = st.number_input("Risk-Free Interest Rate", value=0.05, min_value=0.0, max_value=1.0)
-        sigma = st.number_input("Volatility (σ)", value=0.2, min_value=0.0, max_value=1.0)
+        sigma = st.number_input("Volatility (σ)", value=0.2, min_value=0.01, max_value=1.0)
         option_type = st.selectbox("Option Type", ("Call", "Put"))
 
     # Calculate option price and Greeks
-    option_price = black_scholes(S, K, T, r, sigma, option_type)
-    delta, gamma, theta, vega = option_greeks(S, K, T, r, sigma, option_type)
+    option_price, delta, gamma, theta, vega = price_and_greeks(S, K, T, r, sigma, option_type)
 
     # Display option price and Greeks
     st.markdown('## Option Price and Greeks')
@@ -96,81 +217,28 @@ def main():
 
     S_min = st.number_input("Minimum Underlying Price", value=S * 0.5, min_value=0.01)
     S_max = st.number_input("Maximum Underlying Price", value=S * 1.5, min_value=S)
-    sigma_min = st.number_input("Minimum Volatility", value=0.1, min_value=0.0, max_value=sigma)
+    sigma_min = st.number_input("Minimum Volatility", value=0.1, min_value=0.01, max_value=sigma)
     sigma_max = st.number_input("Maximum Volatility", value=0.5, min_value=sigma, max_value=1.0)
+    resolution = st.slider("Heatmap Resolution", min_value=10, max_value=64, value=10)
 
     if S_min >= S_max or sigma_min >= sigma_max:
         st.error("Minimum values must be less than maximum values.")
         return
 
-    # Generate values for S and sigma
-    S_values = np.linspace(S_min, S_max, 10)
-    sigma_values = np.linspace(sigma_min, sigma_max, 10)
-
-    # Create meshgrid
-    S_grid, sigma_grid = np.meshgrid(S_values, sigma_values)
-
-    # Calculate option prices over the grid
-    option_prices = black_scholes(S_grid, K, T, r, sigma_grid, option_type)
+    S_values, sigma_values, option_prices = _price_grid(
+        S_min, S_max, sigma_min, sigma_max, K, T, r, option_type, resolution)
 
     # Plot heatmap
-    fig, ax = plt.subplots(figsize=(14, 8))
-    sns.heatmap(option_prices,
-                xticklabels=np.round(S_values, 2),
-                yticklabels=np.round(sigma_values, 2),
-                cmap='viridis',
-                ax=ax,
-                annot=True,
-                fmt=".2f",
-                annot_kws={"size": 7})
-
-    plt.setp(ax.get_xticklabels(), rotation=45, ha="right", fontsize=10)
-    plt.setp(ax.get_yticklabels(), fontsize=10)
-
-    ax.set_xlabel("Underlying Price (S)", fontsize=12)
-    ax.set_ylabel("Volatility (σ)", fontsize=12)
-    ax.set_title(f"{option_type} Option Price Heatmap", fontsize=14)
-    fig.tight_layout()
-    st.pyplot(fig)
+    st.image(render_heatmap_png(option_prices, S_values, sigma_values, option_type),
+             use_column_width=True)
 
     # Plot Greeks
     st.markdown("### Option Greeks vs Underlying Price")
-    S_plot = np.linspace(S_min, S_max, 100)
-    delta_p, gamma_p, theta_p, vega_p = option_greeks(S_plot, K, T, r, sigma, option_type)
-
-    fig, axs = plt.subplots(2, 2, figsize=(14, 10))
-    axs = axs.flatten()
-
-    # Delta
-    axs[0].plot(S_plot, delta_p, color='cyan')
-    axs[0].set_title('Delta vs Underlying Price', fontsize=12)
-    axs[0].set_xlabel('Underlying Price (S)', fontsize=10)
-    axs[0].set_ylabel('Delta', fontsize=10)
-    axs[0].grid(True)
-
-    # Gamma
-    axs[1].plot(S_plot, gamma_p, color='magenta')
-    axs[1].set_title('Gamma vs Underlying Price', fontsize=12)
-    axs[1].set_xlabel('Underlying Price (S)', fontsize=10)
-    axs[1].set_ylabel('Gamma', fontsize=10)
-    axs[1].grid(True)
-
-    # Theta
-    axs[2].plot(S_plot, theta_p, color='yellow')
-    axs[2].set_title('Theta vs Underlying Price', fontsize=12)
-    axs[2].set_xlabel('Underlying Price (S)', fontsize=10)
-    axs[2].set_ylabel('Theta', fontsize=10)
-    axs[2].grid(True)
-
-    # Vega
-    axs[3].plot(S_plot, vega_p, color='green')
-    axs[3].set_title('Vega vs Underlying Price', fontsize=12)
-    axs[3].set_xlabel('Underlying Price (S)', fontsize=10)
-    axs[3].set_ylabel('Vega', fontsize=10)
-    axs[3].grid(True)
+    S_plot, delta_p, gamma_p, theta_p, vega_p = _greeks_line(
+        S_min, S_max, K, T, r, sigma, option_type)
 
-    fig.tight_layout(pad=3.0)
-    st.pyplot(fig)
+    st.image(render_greeks_png(S_plot, delta_p, gamma_p, theta_p, vega_p),
+             use_column_width=True)
 
     # Footer
     st.markdown("""
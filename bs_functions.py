@@ -1,5 +1,243 @@
+import math
+import os
+import threading
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+from bs_kernels import INV_SQRT_2PI, SQRT1_2, bs_kernel
+
+# Opt-in GPU backend for array inputs, enabled by BS_GPU=1/true/yes
+if os.environ.get('BS_GPU', '').strip().lower() in ('1', 'true', 'yes'):
+    import cupy
+    from cupyx.scipy.special import ndtr as cupy_ndtr
+else:
+    cupy = None
+
+# Streamlit serves each session from its own thread, but Numba's workqueue
+# threading layer (used when neither TBB nor OpenMP is available) aborts
+# the process on concurrent entry into a parallel kernel. The kernels
+# already use every core, so serializing calls costs no throughput.
+_KERNEL_LOCK = threading.Lock()
+
+def _option_sign(option_type):
+    """
+    Map option_type to the payoff sign phi: +1 for a Call, -1 for a Put.
+    """
+    if option_type == 'Call':
+        return 1.0
+    if option_type == 'Put':
+        return -1.0
+    raise ValueError("option_type must be 'Call' or 'Put'.")
+
+def _as_float(x):
+    """
+    Return x unchanged if it is a Python scalar, otherwise as a float64
+    array (without copying if it already is one).
+    """
+    if isinstance(x, (int, float)):
+        return x
+    return np.asarray(x, dtype=np.float64)
+
+def _nonzero(x):
+    """
+    Replace zeros in x with 1e-10 to avoid division by zero.
+    """
+    if isinstance(x, (int, float)):
+        return x if x != 0 else 1e-10
+    return np.where(x == 0, 1e-10, x)
+
+def _is_array_input(*args):
+    """
+    Return True if any argument is a non-scalar numpy array.
+    """
+    return any(isinstance(a, np.ndarray) and a.ndim > 0 for a in args)
+
+def _bs_arrays(S, K, T, r, sigma, option_type):
+    """
+    Evaluate price and Greeks over array inputs with the fused Numba kernel.
+
+    Inputs are broadcast against each other and passed to the kernel as 2-D
+    views (rows x last axis) without copying, then the outputs are reshaped
+    back to the broadcast shape. float64 results are exact to rounding.
+    float32 inputs are kept in single precision and use the polynomial CDF
+    of the float32 kernel (absolute price error up to ~1e-5).
+
+    Returns:
+    - option_price, delta, gamma, theta, vega
+    """
+    phi = _option_sign(option_type)
+
+    dtype = np.result_type(S, K, T, r, sigma)
+    if dtype != np.float32:
+        dtype = np.dtype(np.float64)
+
+    inputs = [np.asarray(a, dtype=dtype) for a in (S, K, T, r, sigma)]
+    shape = np.broadcast_shapes(*(a.shape for a in inputs))
+    if 0 in shape:
+        return tuple(np.empty(shape, dtype=dtype) for _ in range(5))
+
+    rows = [np.broadcast_to(a, shape).reshape(-1, shape[-1]) for a in inputs]
+
+    outputs = [np.empty(rows[0].shape, dtype=dtype) for _ in range(5)]
+    with _KERNEL_LOCK:
+        bs_kernel(*rows, dtype.type(phi), *outputs)
+
+    # Done here rather than in the kernels, where fastmath lets LLVM drop
+    # an x + 0.0 that only changes the sign of zero
+    price, delta = outputs[0], outputs[1]
+    np.maximum(price, 0, out=price)
+    price += 0
+    delta += 0
+
+    return tuple(out.reshape(shape) for out in outputs)
+
+def _is_scalar_input(*args):
+    """
+    Return True if every argument is a Python int or float.
+    """
+    return all(isinstance(a, (int, float)) for a in args)
+
+def _bs_scalar(S, K, T, r, sigma, option_type):
+    """
+    Evaluate price and Greeks for Python scalar inputs using the math module.
+
+    Avoids numpy ufunc dispatch entirely for the single-point metric display.
+    Degenerate inputs (S, K, T or sigma not positive) and inputs that would
+    overflow a math function (e.g. exp(-r * T) for a large negative rate) are
+    handed to the numpy closed form instead, which yields the same limits
+    (e.g. intrinsic value at T = 0) or inf/nan where the math module would
+    raise.
+
+    Returns:
+    - option_price, delta, gamma, theta, vega
+    """
+    phi = _option_sign(option_type)
+
+    if S > 0 and K > 0 and T > 0 and sigma > 0:
+        try:
+            sqrtT = math.sqrt(T)
+            disc = math.exp(-r * T)
+            inv_sig_sqrtT = 1.0 / (sigma * sqrtT)
+            d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) * inv_sig_sqrtT
+            d2 = d1 - sigma * sqrtT
+            pdf_d1 = math.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+            cdf_d1 = 0.5 * math.erfc(-phi * d1 * SQRT1_2)
+            cdf_d2 = 0.5 * math.erfc(-phi * d2 * SQRT1_2)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            pass
+        else:
+            # phi * 0.0 is -0.0 for a Put; + 0.0 displays it as 0.00 again,
+            # and max() removes rounding noise below zero
+            option_price = max(phi * (S * cdf_d1 - K * disc * cdf_d2), 0.0) + 0.0
+
+            delta = phi * cdf_d1 + 0.0
+            theta = (-S * pdf_d1 * sigma) / (2 * sqrtT) \
+                    - phi * r * K * disc * cdf_d2
+            gamma = pdf_d1 * inv_sig_sqrtT / S
+            vega = S * pdf_d1 * sqrtT
+
+            return option_price, delta, gamma, theta, vega
+
+    inputs = (np.float64(a) for a in (S, K, T, r, sigma))
+    return _bs_closed_form(*inputs, phi, np, ndtr)
+
+def _price_and_greeks(S, K, T, r, sigma, option_type):
+    """
+    Compute price and Greeks in one pass, with no input sanitization.
+
+    Returns:
+    - option_price, delta, gamma, theta, vega
+    """
+    if _is_scalar_input(S, K, T, r, sigma):
+        return _bs_scalar(S, K, T, r, sigma, option_type)
+    if _is_array_input(S, K, T, r, sigma):
+        if cupy is not None:
+            return _bs_gpu(S, K, T, r, sigma, option_type)
+        return _bs_arrays(S, K, T, r, sigma, option_type)
+
+    return _bs_closed_form(S, K, T, r, sigma, _option_sign(option_type), np, ndtr)
+
+def _bs_gpu(S, K, T, r, sigma, option_type):
+    """
+    Evaluate price and Greeks over array inputs on the GPU with CuPy.
+
+    Inputs are copied to the device, evaluated with the closed form and the
+    results copied back for matplotlib. Precision follows _bs_arrays.
+
+    Returns:
+    - option_price, delta, gamma, theta, vega as numpy arrays
+    """
+    phi = _option_sign(option_type)
+    dtype = np.result_type(S, K, T, r, sigma)
+    if dtype != np.float32:
+        dtype = np.float64
+
+    inputs = [cupy.asarray(a, dtype=dtype) for a in (S, K, T, r, sigma)]
+    outputs = _bs_closed_form(*inputs, phi, cupy, cupy_ndtr)
+
+    return tuple(out.get() for out in outputs)
+
+def _bs_closed_form(S, K, T, r, sigma, phi, xp, ndtr):
+    """
+    Closed-form price and Greeks written against an array module.
+
+    Parameters:
+    - S, K, T, r, sigma: Inputs as xp arrays or scalars
+    - phi: payoff sign, +1.0 for a Call and -1.0 for a Put
+    - xp: Array module providing log, exp and sqrt (numpy or cupy)
+    - ndtr: Standard normal CDF for xp arrays
+
+    Returns:
+    - option_price, delta, gamma, theta, vega
+    """
+    sqrtT = xp.sqrt(T)
+    disc = xp.exp(-r * T)
+    inv_sig_sqrtT = 1.0 / (sigma * sqrtT)
+    d1 = (xp.log(S / K) + (r + 0.5 * sigma * sigma) * T) * inv_sig_sqrtT
+    d2 = d1 - sigma * sqrtT
+    pdf_d1 = xp.exp(-0.5 * d1 * d1) * INV_SQRT_2PI
+    cdf_d1 = ndtr(phi * d1)
+    cdf_d2 = ndtr(phi * d2)
+
+    # phi * 0.0 is -0.0 for a Put; + 0.0 displays it as 0.00 again, and
+    # maximum() removes rounding noise below zero
+    option_price = xp.maximum(phi * (S * cdf_d1 - K * disc * cdf_d2), 0.0) + 0.0
+
+    # Calculate Greeks
+    delta = phi * cdf_d1 + 0.0
+    theta = (-S * pdf_d1 * sigma) / (2 * sqrtT) \
+            - phi * r * K * disc * cdf_d2
+    gamma = pdf_d1 * inv_sig_sqrtT / S
+    vega = S * pdf_d1 * sqrtT
+
+    return option_price, delta, gamma, theta, vega
+
+def price_and_greeks(S, K, T, r, sigma, option_type='Call'):
+    """
+    Calculate the price and Greeks of a European option in a single pass.
+
+    d1, d2 and the discount factor are computed once and shared between the
+    price and all four Greeks.
+
+    Parameters:
+    - S: Current price of the underlying asset
+    - K: Strike price
+    - T: Time to expiration in years
+    - r: Annual risk-free interest rate
+    - sigma: Annualized volatility
+    - option_type: 'Call' or 'Put'
+
+    Returns:
+    - option_price, delta, gamma, theta, vega: Calculated price and Greeks
+    """
+    # Convert inputs to numpy arrays for vectorization; Python scalars are
+    # left as they are
+    S, K, T, r, sigma = (_as_float(a) for a in (S, K, T, r, sigma))
+
+    # Avoid division by zero
+    sigma = _nonzero(sigma)
+    T = _nonzero(T)
+
+    return _price_and_greeks(S, K, T, r, sigma, option_type)
 
 def black_scholes(S, K, T, r, sigma, option_type='Call'):
     """
@@ -15,23 +253,18 @@ def black_scholes(S, K, T, r, sigma, option_type='Call'):
 
     Returns:
     - option_price: Calculated option price
-    """
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-
-    if option_type == 'Call':
-        option_price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
-    elif option_type == 'Put':
-        option_price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-    else:
-        raise ValueError("option_type must be 'Call' or 'Put'.")
 
-    return option_price
+    float32 array inputs are priced in single precision with a polynomial
+    normal CDF (absolute error up to ~1e-5); all other inputs are exact.
+    """
+    return _price_and_greeks(S, K, T, r, sigma, option_type)[0]
 
-def option_greeks(S, K, T, r, sigma, option_type='Call'):
+def option_greeks_safe(S, K, T, r, sigma, option_type='Call'):
     """
     Calculate the Greeks for a European option using the Black-Scholes Model.
 
+    Zero sigma or T are replaced by 1e-10 to avoid division by zero.
+
     Parameters:
     - S: Current price of the underlying asset
     - K: Strike price
@@ -43,33 +276,27 @@ def option_greeks(S, K, T, r, sigma, option_type='Call'):
     Returns:
     - delta, gamma, theta, vega: Calculated Greeks
     """
-    # Convert inputs to numpy arrays for vectorization
-    S = np.array(S, dtype=float)
-    K = np.array(K, dtype=float)
-    T = np.array(T, dtype=float)
-    r = np.array(r, dtype=float)
-    sigma = np.array(sigma, dtype=float)
+    return price_and_greeks(S, K, T, r, sigma, option_type)[1:]
 
-    # Avoid division by zero
-    sigma = np.where(sigma == 0, 1e-10, sigma)
-    T = np.where(T == 0, 1e-10, T)
+def option_greeks_fast(S, K, T, r, sigma, option_type='Call'):
+    """
+    Calculate the Greeks for a European option without input sanitization.
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    Callers must guarantee sigma > 0 and T > 0; array inputs are passed to
+    the kernel without conversion or copies, so float32 arrays get the
+    single-precision polynomial CDF (absolute error up to ~1e-5).
 
-    # Calculate Greeks
-    if option_type == 'Call':
-        delta = norm.cdf(d1)
-        theta = (-S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) \
-                - r * K * np.exp(-r * T) * norm.cdf(d2)
-    elif option_type == 'Put':
-        delta = norm.cdf(d1) - 1
-        theta = (-S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) \
-                + r * K * np.exp(-r * T) * norm.cdf(-d2)
-    else:
-        raise ValueError("option_type must be 'Call' or 'Put'.")
-
-    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
-    vega = S * norm.pdf(d1) * np.sqrt(T)
-
-    return delta, gamma, theta, vega
+    Parameters:
+    - S: Current price of the underlying asset
+    - K: Strike price
+    - T: Time to expiration in years
+    - r: Annual risk-free interest rate
+    - sigma: Annualized volatility
+    - option_type: 'Call' or 'Put'
+
+    Returns:
+    - delta, gamma, theta, vega: Calculated Greeks
+    """
+    return _price_and_greeks(S, K, T, r, sigma, option_type)[1:]
+
+option_greeks = option_greeks_safe
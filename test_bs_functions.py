@@ -0,0 +1,184 @@
+import os
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+from scipy.stats import norm
+
+from bs_functions import (_bs_arrays, _bs_closed_form, black_scholes, option_greeks,
+                          price_and_greeks)
+
+# Absolute tolerance of the polynomial normal CDF used by the float32 kernel
+POLY_CDF_TOL = 1e-4
+
+# float64 paths are exact up to rounding and must agree with each other
+EXACT_RTOL = 1e-12
+
+def reference_price_and_greeks(S, K, T, r, sigma, option_type):
+    """
+    The original scipy.stats.norm Black-Scholes formulas.
+    """
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+
+    if option_type == 'Call':
+        price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        delta = norm.cdf(d1)
+        theta = (-S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) \
+                - r * K * np.exp(-r * T) * norm.cdf(d2)
+    else:
+        price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+        delta = norm.cdf(d1) - 1
+        theta = (-S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) \
+                + r * K * np.exp(-r * T) * norm.cdf(-d2)
+
+    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    vega = S * norm.pdf(d1) * np.sqrt(T)
+
+    return price, delta, gamma, theta, vega
+
+@pytest.mark.parametrize("option_type, expected", [
+    ('Call', (10.450583572185565, 0.6368306511756191, 0.018762017345846895,
+              -6.414027546438197, 37.52403469169379)),
+    ('Put', (5.573526022256971, -0.3631693488243809, 0.018762017345846895,
+             -1.657880423934626, 37.52403469169379)),
+])
+def test_atm_values(option_type, expected):
+    result = price_and_greeks(100.0, 100.0, 1.0, 0.05, 0.2, option_type)
+    reference = reference_price_and_greeks(100.0, 100.0, 1.0, 0.05, 0.2, option_type)
+
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+    np.testing.assert_allclose(result, reference, rtol=1e-12)
+    assert black_scholes(100.0, 100.0, 1.0, 0.05, 0.2, option_type) == pytest.approx(expected[0])
+    np.testing.assert_allclose(option_greeks(100.0, 100.0, 1.0, 0.05, 0.2, option_type),
+                               expected[1:], rtol=1e-12)
+
+@pytest.mark.parametrize("option_type", ['Call', 'Put'])
+def test_scalar_array_and_float32_agree(option_type):
+    S = np.linspace(50.0, 150.0, 11)
+    sigma = np.linspace(0.1, 0.5, 7)[:, np.newaxis]
+
+    array_result = price_and_greeks(S, 100.0, 1.0, 0.05, sigma, option_type)
+    f32_price = black_scholes(S.astype(np.float32), 100.0, 1.0, 0.05,
+                              sigma.astype(np.float32), option_type)
+    reference = reference_price_and_greeks(S, 100.0, 1.0, 0.05, sigma, option_type)
+
+    for result, expected in zip(array_result, reference):
+        assert result.shape == (7, 11)
+        np.testing.assert_allclose(result, expected, rtol=EXACT_RTOL, atol=1e-12)
+
+    assert f32_price.dtype == np.float32
+    np.testing.assert_allclose(f32_price, reference[0], rtol=1e-5, atol=POLY_CDF_TOL)
+
+    for i, s in enumerate(S):
+        scalar_result = price_and_greeks(float(s), 100.0, 1.0, 0.05, 0.3, option_type)
+        line_result = price_and_greeks(S, 100.0, 1.0, 0.05, 0.3, option_type)
+        np.testing.assert_allclose([out[i] for out in line_result], scalar_result,
+                                   rtol=EXACT_RTOL, atol=1e-12)
+
+@pytest.mark.parametrize("S", [100.0, np.array([90.0, 100.0])])
+def test_invalid_option_type(S):
+    with pytest.raises(ValueError, match="option_type must be 'Call' or 'Put'"):
+        black_scholes(S, 100.0, 1.0, 0.05, 0.2, 'Straddle')
+    with pytest.raises(ValueError, match="option_type must be 'Call' or 'Put'"):
+        option_greeks(S, 100.0, 1.0, 0.05, 0.2, 'Straddle')
+
+@pytest.mark.parametrize("S", [np.array([]), np.empty((0, 3)), np.empty((3, 0))])
+def test_empty_array_input(S):
+    result = price_and_greeks(S, 100.0, 1.0, 0.05, 0.2)
+
+    for out in result:
+        assert out.shape == S.shape
+    assert black_scholes(S, 100.0, 1.0, 0.05, 0.2).shape == S.shape
+
+def test_concurrent_array_calls():
+    S = np.linspace(50.0, 150.0, 64)[np.newaxis, :]
+    expected = black_scholes(S, 100.0, 1.0, 0.05, np.linspace(0.1, 0.5, 64)[:, np.newaxis])
+    failures = []
+
+    def worker():
+        for _ in range(50):
+            sigma = np.linspace(0.1, 0.5, 64)[:, np.newaxis]
+            if not np.array_equal(black_scholes(S, 100.0, 1.0, 0.05, sigma), expected):
+                failures.append(True)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
+
+@pytest.mark.parametrize("S, T, sigma, expected", [
+    (100.0, 1.0, 0.0, 100.0 - 100.0 * np.exp(-0.05)),
+    (110.0, 0.0, 0.2, 10.0),
+])
+def test_degenerate_scalar_limits(S, T, sigma, expected):
+    with np.errstate(all='ignore'):
+        price = black_scholes(S, 100.0, T, 0.05, sigma)
+
+    assert price == pytest.approx(expected)
+
+def test_non_positive_underlying_gives_nan():
+    with np.errstate(all='ignore'):
+        price = black_scholes(-1.0, 100.0, 1.0, 0.05, 0.2)
+
+    assert np.isnan(price)
+
+@pytest.mark.parametrize("option_type, phi", [('Call', 1.0), ('Put', -1.0)])
+def test_closed_form_matches_kernel(option_type, phi):
+    # _bs_closed_form is the whole GPU implementation, run here with numpy
+    S = np.linspace(50.0, 150.0, 9)[np.newaxis, :]
+    sigma = np.linspace(0.1, 0.5, 5)[:, np.newaxis]
+
+    closed_form = _bs_closed_form(S, 100.0, 1.0, 0.05, sigma, phi, np, ndtr)
+    kernel = _bs_arrays(S, 100.0, 1.0, 0.05, sigma, option_type)
+
+    for expected, result in zip(kernel, closed_form):
+        np.testing.assert_allclose(result, expected, rtol=EXACT_RTOL, atol=1e-12)
+
+@pytest.mark.parametrize("value", ['', '0', 'false', 'no'])
+def test_gpu_backend_disabled_for_falsy_env(value):
+    env = dict(os.environ, BS_GPU=value)
+    code = "import bs_functions; print(bs_functions.cupy is None)"
+    result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    assert result.stdout.strip() == 'True', result.stderr
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_deep_otm_put_has_no_negative_zero(dtype):
+    price, delta = price_and_greeks(150.0, 100.0, 1.0, 0.05, 0.01, 'Put')[:2]
+
+    assert f"${price:.2f}" == "$0.00"
+    assert f"{delta:.2f}" == "0.00"
+
+    S = np.linspace(75.0, 225.0, 10, dtype=dtype)[np.newaxis, :]
+    sigma = np.linspace(0.01, 0.5, 10, dtype=dtype)[:, np.newaxis]
+    prices, deltas = price_and_greeks(S, 100.0, 1.0, 0.05, sigma, 'Put')[:2]
+    dtype_prices = black_scholes(S, 100.0, 1.0, 0.05, sigma, 'Put')
+
+    for values in (prices, dtype_prices):
+        assert "-0.00" not in {f"{value:.2f}" for value in values.ravel()}
+    # Small negative Put deltas legitimately round to -0.00; only an exact
+    # negative zero is a sign-trick artefact
+    assert not np.any((deltas == 0) & np.signbit(deltas))
+    with np.errstate(all='ignore'):
+        degenerate = black_scholes(150.0, 100.0, 1.0, 0.05, 0.0, 'Put')
+    assert f"{degenerate:.2f}" == "0.00"
+
+@pytest.mark.parametrize("inputs", [
+    (100.0, 100.0, 1.0, -800.0, 0.2),
+    (100.0, 100.0, 1.0, 0.05, 1e-300),
+    (1e308, 1e-308, 1.0, 0.05, 0.2),
+])
+def test_scalar_overflow_matches_closed_form(inputs):
+    with np.errstate(all='ignore'):
+        result = price_and_greeks(*inputs)
+        expected = _bs_closed_form(*(np.float64(a) for a in inputs), 1.0, np, ndtr)
+
+    np.testing.assert_allclose(result, expected, rtol=EXACT_RTOL)